@@ -7,16 +7,23 @@ Caches parsed nodes and edges to avoid repeatedly parsing .ilean files
 
 import hashlib
 import json
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from . import json_io
 from .models import Node, Edge
 from .models.node import NodeMeta, ProofStatus
+from .parsers.ilean_parser import LAKEFILE_LEAN_LIB, LAKEFILE_PACKAGE, LAKEFILE_TOML_LEAN_LIB
 
 
 CACHE_VERSION = "1.0"
 
+# lakefile.toml fallback: first name = "..." anywhere in the file
+LAKEFILE_TOML_NAME = re.compile(r'name\s*=\s*["\'](\w+)["\']')
+
 
 class GraphCache:
     """Manages reading and writing of .astrolabe/graph.json"""
@@ -82,17 +89,15 @@ class GraphCache:
 
     def _get_project_name(self) -> str:
         """Get project name from lakefile"""
-        import re
-
         # Try lakefile.lean
         lakefile_lean = self.project_path / "lakefile.lean"
         if lakefile_lean.exists():
             try:
                 content = lakefile_lean.read_text(encoding="utf-8")
-                match = re.search(r'lean_lib\s+(\w+)', content)
+                match = LAKEFILE_LEAN_LIB.search(content)
                 if match:
                     return match.group(1)
-                match = re.search(r'package\s+(\w+)', content)
+                match = LAKEFILE_PACKAGE.search(content)
                 if match:
                     return match.group(1)
             except Exception:
@@ -103,10 +108,10 @@ class GraphCache:
         if lakefile_toml.exists():
             try:
                 content = lakefile_toml.read_text(encoding="utf-8")
-                match = re.search(r'\[\[lean_lib\]\][^\[]*name\s*=\s*["\'](\w+)["\']', content, re.DOTALL)
+                match = LAKEFILE_TOML_LEAN_LIB.search(content)
                 if match:
                     return match.group(1)
-                match = re.search(r'name\s*=\s*["\'](\w+)["\']', content)
+                match = LAKEFILE_TOML_NAME.search(content)
                 if match:
                     return match.group(1)
             except Exception:
@@ -126,8 +131,7 @@ class GraphCache:
             return False
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.loads(self.cache_file.read_bytes())
 
             # Check version
             if data.get("version") != CACHE_VERSION:
@@ -159,14 +163,15 @@ class GraphCache:
             return None
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.loads(self.cache_file.read_bytes())
 
             # All node status defaults to unknown, may be updated in real-time
 
+            # Node ids are interned so every node, edge endpoint and index
+            # that mentions one shares a single string object
             nodes = []
             for n in data.get("nodes", []):
-                node_id = n["id"]
+                node_id = sys.intern(n["id"])
                 # Default status is unknown
                 node = Node(
                     id=node_id,
@@ -189,8 +194,8 @@ class GraphCache:
             edges = []
             for e in data.get("edges", []):
                 edge = Edge(
-                    source=e["source"],
-                    target=e["target"],
+                    source=sys.intern(e["source"]),
+                    target=sys.intern(e["target"]),
                     from_lean=e.get("from_lean", True),
                     default_color=e.get("default_color", "#2ecc71"),
                     default_width=e.get("default_width", 1.0),
@@ -253,8 +258,9 @@ class GraphCache:
             ],
         }
 
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Compact (no indentation): graph.json is a machine-read cache,
+        # indentation added about a third to its size
+        self.cache_file.write_bytes(json_io.dumps(data))
 
         print(f"[GraphCache] Saved {len(nodes)} nodes, {len(edges)} edges to cache")
 
@@ -280,8 +286,7 @@ class GraphCache:
         data = {}
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = json_io.loads(self.cache_file.read_bytes())
             except (json.JSONDecodeError, IOError):
                 data = {}
 
@@ -297,8 +302,7 @@ class GraphCache:
             }
 
         # Save
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.cache_file.write_bytes(json_io.dumps(data))
 
         print(f"[GraphCache] Updated positions for {len(positions)} nodes")
 
@@ -313,8 +317,7 @@ class GraphCache:
             return {}
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.loads(self.cache_file.read_bytes())
             return data.get("positions", {})
         except (json.JSONDecodeError, IOError):
             return {}
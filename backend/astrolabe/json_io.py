@@ -0,0 +1,36 @@
+"""
+JSON I/O
+
+Fast JSON encoding/decoding for cache and meta files.
+Uses orjson (C extension) when installed, falls back to the standard library json module.
+
+Both backends produce the same data: UTF-8 bytes, non-ASCII characters kept as-is.
+Decode errors are always json.JSONDecodeError (orjson's error is a subclass).
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with `pip install astrolabe[fast]`
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes
+
+    Args:
+        obj: Object to serialize (dict keys must be strings)
+        indent: If True, pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeMeta:
     """
     User-editable edge properties via UI, stored in edges namespace of .astrolabe/meta.json
@@ -33,7 +33,7 @@ class EdgeMeta:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """
     Astrolabe Edge
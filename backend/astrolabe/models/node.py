@@ -10,7 +10,7 @@ class ProofStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMeta:
     """User-editable properties via UI, stored in .astrolabe/meta.json"""
 
@@ -64,7 +64,7 @@ class NodeMeta:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """
     Astrolabe Node
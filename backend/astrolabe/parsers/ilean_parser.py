@@ -12,20 +12,73 @@ This is faster and more accurate than regex parsing.
 
 import json
 import re
+import sys
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from .. import json_io
 from ..models.node import Node, NodeMeta, ProofStatus
 
 logger = logging.getLogger(__name__)
 
-# sorry detection regex: match standalone sorry keyword, excluding comments
-SORRY_PATTERN = re.compile(r'\bsorry\b')
-# line comment
-LINE_COMMENT = re.compile(r'--.*$', re.MULTILINE)
-# block comment
-BLOCK_COMMENT = re.compile(r'/-.*?-/', re.DOTALL)
+# sorry detection: one left-to-right scan over block comments, line comments
+# and the standalone sorry keyword; whichever starts first wins, so a sorry
+# inside a comment is consumed as part of the comment
+SORRY_OR_COMMENT = re.compile(r'/-.*?-/|--[^\n]*|\bsorry\b', re.DOTALL)
+
+# lakefile.lean: lean_lib / package name
+LAKEFILE_LEAN_LIB = re.compile(r'lean_lib\s+(\w+)')
+LAKEFILE_PACKAGE = re.compile(r'package\s+(\w+)')
+# lakefile.toml: [[lean_lib]] name = "..." / [package] name = "..."
+LAKEFILE_TOML_LEAN_LIB = re.compile(r'\[\[lean_lib\]\][^\[]*name\s*=\s*["\'](\w+)["\']', re.DOTALL)
+LAKEFILE_TOML_PACKAGE = re.compile(r'\[package\][^\[]*name\s*=\s*["\'](\w+)["\']', re.DOTALL)
+
+# Memoized parse results of individual .ilean files, per project, least recently loaded first
+# {project_root: {(ilean_path, lazy_content): (ilean_signature, source_file, source_signature, result)}}
+_PARSE_CACHE: OrderedDict[str, dict[tuple, tuple]] = OrderedDict()
+_PARSE_CACHE_MAX_PROJECTS = 4
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it can't be stat'ed"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def clear_parse_cache(project_root: Optional[Path] = None):
+    """
+    Drop memoized .ilean parse results
+
+    Args:
+        project_root: Only drop this project's results; if None, drop everything
+            (including decoded reference keys)
+    """
+    if project_root is not None:
+        _PARSE_CACHE.pop(str(project_root), None)
+        return
+    _PARSE_CACHE.clear()
+    _decode_ref_key.cache_clear()
+
+
+def _project_parse_cache(project_root: Path) -> dict[tuple, tuple]:
+    """Get (or create) a project's parse cache, evicting the least recently used project"""
+    key = str(project_root)
+    cache = _PARSE_CACHE.get(key)
+    if cache is None:
+        cache = _PARSE_CACHE[key] = {}
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX_PROJECTS:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        _PARSE_CACHE.move_to_end(key)
+    return cache
 
 
 def parse_ilean_file(
@@ -36,6 +89,11 @@ def parse_ilean_file(
     """
     Parse a single .ilean file
 
+    Results are memoized per file and reused as long as neither the .ilean file
+    nor its .lean source has changed (mtime and size), so reloading a project
+    after a single file is rebuilt only re-parses that file. Only the most
+    recently loaded projects are kept, see clear_parse_cache().
+
     Args:
         ilean_path: .ilean file path
         project_root: project root directory (for locating source files)
@@ -47,12 +105,71 @@ def parse_ilean_file(
         - imports: list of imported modules
         - usage_map: {decl_full_name: [used_by_locations...]} for building edges
     """
+    cache = _project_parse_cache(project_root)
+    cache_key = (str(ilean_path), lazy_content)
+    ilean_signature = _file_signature(Path(ilean_path))
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        cached_signature, source_file, source_signature, result = cached
+        if cached_signature == ilean_signature and _file_signature(source_file) == source_signature:
+            return _copy_parse_result(result)
+
+    result, source_file = _parse_ilean_file_uncached(ilean_path, project_root, lazy_content)
+
+    # Only cache successful parses whose source file could be located
+    if ilean_signature is not None and source_file is not None:
+        cache[cache_key] = (ilean_signature, source_file, _file_signature(source_file), result)
+
+    return _copy_parse_result(result)
+
+
+def _copy_parse_result(result: tuple[list[Node], list[str], dict]) -> tuple[list[Node], list[str], dict]:
+    """Copy a (possibly cached) parse result so callers can mutate it freely"""
+    nodes, imports, usage_map = result
+    return (
+        [replace(node, references=list(node.references), meta=NodeMeta()) for node in nodes],
+        list(imports),
+        {name: list(usages) for name, usages in usage_map.items()},
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _decode_ref_key(ref_key: str) -> Optional[tuple[str, str]]:
+    """
+    Decode a .ilean references key to (module, name)
+
+    The same constant (e.g. a Mathlib lemma) is referenced from many modules,
+    so identical keys recur across files; decoding is memoized.
+
+    Returns:
+        (module, name), or None if the key is not a constant reference
+
+    Raises:
+        json.JSONDecodeError: Malformed key (not cached)
+    """
+    ref_info = json_io.loads(ref_key)
+    if "c" not in ref_info:
+        return None
+    return ref_info["c"].get("m", ""), ref_info["c"].get("n", "")
+
+
+def _parse_ilean_file_uncached(
+    ilean_path: Path,
+    project_root: Path,
+    lazy_content: bool
+) -> tuple[tuple[list[Node], list[str], dict], Optional[Path]]:
+    """
+    Parse a single .ilean file without consulting the cache
+
+    Returns:
+        ((nodes, imports, usage_map), source_file)
+    """
     try:
-        with open(ilean_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_io.loads(ilean_path.read_bytes())
     except (json.JSONDecodeError, FileNotFoundError) as e:
         print(f"[ilean] Error reading {ilean_path}: {e}")
-        return [], [], {}
+        return ([], [], {}), None
 
     module_name = data.get("module", "")
     direct_imports = data.get("directImports", [])
@@ -78,13 +195,13 @@ def parse_ilean_file(
         # Parse ref_key to get declaration information
         # Format: {"c":{"m":"Module.Name","n":"decl_name"}}
         try:
-            ref_info = json.loads(ref_key)
-            if "c" not in ref_info:
+            decoded = _decode_ref_key(ref_key)
+            if decoded is None:
                 continue
 
-            decl_module = ref_info["c"].get("m", "")
-            decl_name = ref_info["c"].get("n", "")
-            full_name = f"{decl_module}.{decl_name}"
+            decl_module, decl_name = decoded
+            # Interned: the same id is a usage_map key, a node id and an edge endpoint
+            full_name = sys.intern(f"{decl_module}.{decl_name}")
 
             definition = ref_data.get("definition")
             usages = ref_data.get("usages", [])
@@ -174,7 +291,7 @@ def parse_ilean_file(
         )
         nodes.append(node)
 
-    return nodes, imports, usage_map
+    return (nodes, imports, usage_map), source_file
 
 
 def find_source_file(module_name: str, project_root: Path) -> Optional[Path]:
@@ -237,6 +354,22 @@ DECL_KEYWORDS = {
     "instance", "axiom", "abbrev", "example", "inductive", "opaque"
 }
 
+# Declaration keyword -> node kind (anything unlisted falls back to "definition")
+KEYWORD_KINDS = {
+    "theorem": "theorem",
+    "lemma": "lemma",
+    "def": "definition",
+    "definition": "definition",
+    "abbrev": "definition",
+    "structure": "structure",
+    "class": "class",
+    "instance": "instance",
+    "axiom": "axiom",
+    "inductive": "inductive",
+    "example": "example",
+    "opaque": "opaque",
+}
+
 # Lean 4 declaration modifiers that can precede keywords
 DECL_MODIFIERS = {
     "noncomputable", "protected", "private", "partial", "unsafe", "scoped"
@@ -286,15 +419,15 @@ def detect_sorry(content: str) -> bool:
     Returns:
         True if contains sorry
     """
-    if not content:
+    # Fast path: most declarations never mention sorry, a plain substring scan rules them out
+    if not content or "sorry" not in content:
         return False
 
-    # Remove comments
-    content_clean = BLOCK_COMMENT.sub("", content)
-    content_clean = LINE_COMMENT.sub("", content_clean)
-
-    # Detect sorry
-    return bool(SORRY_PATTERN.search(content_clean))
+    # Single pass, no comment-stripped copy of the content
+    for match in SORRY_OR_COMMENT.finditer(content):
+        if match.group() == "sorry":
+            return True
+    return False
 
 
 def find_declaration_by_name(lines: list[str], name: str, hint_line: int) -> int:
@@ -409,40 +542,14 @@ def infer_kind(content: str) -> str:
         "noncomputable def bar : ..." -> "definition"
         "@[simp] protected lemma baz : ..." -> "lemma"
     """
-    # Get the first line to find the keyword
-    first_line = content.strip().split('\n')[0] if content else ""
+    # Get the first line to find the keyword (without splitting the whole declaration)
+    first_line = content.lstrip().partition('\n')[0] if content else ""
 
     # Use the helper to find the keyword
     keyword = find_decl_keyword_in_line(first_line)
 
-    if keyword is None:
-        return "definition"  # fallback
-
-    # Map keywords to kinds
-    if keyword == "theorem":
-        return "theorem"
-    elif keyword == "lemma":
-        return "lemma"
-    elif keyword in ("def", "definition"):
-        return "definition"
-    elif keyword == "structure":
-        return "structure"
-    elif keyword == "class":
-        return "class"
-    elif keyword == "instance":
-        return "instance"
-    elif keyword == "axiom":
-        return "axiom"
-    elif keyword == "inductive":
-        return "inductive"
-    elif keyword == "abbrev":
-        return "definition"
-    elif keyword == "example":
-        return "example"
-    elif keyword == "opaque":
-        return "opaque"
-    else:
-        return "definition"
+    # Map keywords to kinds (None -> fallback)
+    return KEYWORD_KINDS.get(keyword, "definition")
 
 
 def get_project_name(project_root: Path) -> str:
@@ -462,12 +569,11 @@ def get_project_name(project_root: Path) -> str:
             content = lakefile_lean.read_text(encoding="utf-8")
             # Match name defined in lean_lib or lean_exe
             # Example: lean_lib StrongPNT or @[default_target] lean_lib StrongPNT
-            import re
-            match = re.search(r'lean_lib\s+(\w+)', content)
+            match = LAKEFILE_LEAN_LIB.search(content)
             if match:
                 return match.group(1)
             # Or package name
-            match = re.search(r'package\s+(\w+)', content)
+            match = LAKEFILE_PACKAGE.search(content)
             if match:
                 return match.group(1)
         except Exception:
@@ -478,13 +584,12 @@ def get_project_name(project_root: Path) -> str:
     if lakefile_toml.exists():
         try:
             content = lakefile_toml.read_text(encoding="utf-8")
-            import re
             # Match [[lean_lib]] name = "..." or name = "..."
-            match = re.search(r'\[\[lean_lib\]\][^\[]*name\s*=\s*["\'](\w+)["\']', content, re.DOTALL)
+            match = LAKEFILE_TOML_LEAN_LIB.search(content)
             if match:
                 return match.group(1)
             # Or [package] name = "..."
-            match = re.search(r'\[package\][^\[]*name\s*=\s*["\'](\w+)["\']', content, re.DOTALL)
+            match = LAKEFILE_TOML_PACKAGE.search(content)
             if match:
                 return match.group(1)
         except Exception:
@@ -588,6 +693,12 @@ def parse_project_from_cache(
 
         print(f"[ilean] Parsed {ilean_file.name}: {len(filtered_nodes)}/{len(nodes)} theorems/lemmas")
 
+    # Forget memoized results of .ilean files that are gone (deleted or renamed modules)
+    parse_cache = _project_parse_cache(project_root)
+    current_files = {str(f) for f in ilean_files}
+    for cache_key in [k for k in parse_cache if k[0] not in current_files]:
+        del parse_cache[cache_key]
+
     # Build edges (from usage_map)
     # usage_map records which locations each declaration is used at
     # We need to find which declaration the usage location belongs to, thus building source -> target edges
@@ -610,24 +721,20 @@ def parse_project_from_cache(
         node_ranges[mod].append((node.line_number, node.id))
 
     # Sort by line number and calculate ranges
+    node_starts = {}  # module -> [start_line, ...] (parallel to node_ranges, for bisect)
     for mod in node_ranges:
         node_ranges[mod].sort(key=lambda x: x[0])
+        node_starts[mod] = [start_line for start_line, _ in node_ranges[mod]]
 
     def find_node_at_line(module: str, line: int) -> Optional[str]:
-        """Find the node at a given line number"""
+        """Find the node at a given line number (last node starting at or before it)"""
         if module not in node_ranges:
             return None
-        ranges = node_ranges[module]
-        # Binary search or linear search
-        for i, (start_line, node_id) in enumerate(ranges):
-            # If after this node, before the next node
-            if line >= start_line:
-                if i + 1 < len(ranges):
-                    if line < ranges[i + 1][0]:
-                        return node_id
-                else:
-                    return node_id
-        return None
+        # Binary search: the node covers from its line up to the next node's line
+        i = bisect_right(node_starts[module], line) - 1
+        if i < 0:
+            return None
+        return node_ranges[module][i][1]
 
     # Build edges from usage_map
     for target_id, usages in all_usage_maps.items():
@@ -642,7 +749,7 @@ def parse_project_from_cache(
 
             if user_name:
                 # Has explicit user name
-                source_id = f"{user_module}.{user_name}"
+                source_id = sys.intern(f"{user_module}.{user_name}")
             else:
                 # Infer user from line number
                 source_id = find_node_at_line(user_module, usage_line)
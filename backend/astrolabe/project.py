@@ -7,6 +7,7 @@ Only uses .ilean parsing, no longer supports regex fallback
 
 from typing import Callable, Awaitable, Optional
 from pathlib import Path
+import asyncio
 import time
 import json
 
@@ -115,9 +116,14 @@ class Project:
         self.project_path = Path(path)
         self.nodes: dict[str, Node] = {}
         self.edges: list[Edge] = []
+        self._edges_by_id: dict[str, Edge] = {}  # edge.id -> Edge, rebuilt with meta merge
+        # Adjacency of loaded nodes, rebuilt with node stats
+        self._depends_on: dict[str, list[str]] = {}  # node -> nodes it depends on
+        self._used_by: dict[str, list[str]] = {}     # node -> nodes depending on it
         self.storage: Optional[UnifiedStorage] = None  # Unified storage
         self.graph_cache = GraphCache(path)
         self._watcher: Optional[FileWatcher] = None
+        self._load_lock = asyncio.Lock()  # Serializes load(), parsing yields the event loop
 
     async def load(self, skip_edges: bool = False):
         """
@@ -129,25 +135,49 @@ class Project:
 
         If .ilean doesn't exist, prompt user to run `lake build`
 
+        Overlapping calls (e.g. a watcher reload during /api/project/load) run one
+        after another. The previous nodes and edges stay visible until the new
+        ones are ready.
+
         Args:
             skip_edges: If True, skip edge construction (large projects can show nodes first)
         """
+        async with self._load_lock:
+            await self._load(skip_edges)
+
+    async def ensure_loaded(self):
+        """
+        Wait for an in-flight load() to finish, loading now if the project never loaded
+
+        Request handlers call this before reading nodes or storage, so they never
+        see a project whose first load is still parsing.
+        """
+        async with self._load_lock:
+            if self.storage is None:
+                await self._load()
+
+    async def wait_for_load(self):
+        """Wait for an in-flight load() to finish, without starting one"""
+        async with self._load_lock:
+            pass
+
+    async def _load(self, skip_edges: bool = False):
+        """Load project, caller holds _load_lock"""
         start_time = time.time()
 
-        # Clear existing data
-        self.nodes.clear()
-        self.edges.clear()
+        # Parse into locals, swapped in once loading is complete
+        nodes: dict[str, Node] = {}
+        edges: list[Edge] = []
 
         project_path = Path(self.path)
         loaded = False
 
         # 1. Try loading from graph.json cache
-        cached = self.graph_cache.load()
+        cached = await asyncio.to_thread(self.graph_cache.load)
         if cached:
-            nodes, edges = cached
-            for node in nodes:
-                self.nodes[node.id] = node
-            self.edges = edges
+            cached_nodes, edges = cached
+            for node in cached_nodes:
+                nodes[node.id] = node
             loaded = True
             elapsed = time.time() - start_time
             print(f"[Project] Loaded from graph.json cache in {elapsed:.2f}s")
@@ -159,12 +189,12 @@ class Project:
             if cache_path.exists():
                 try:
                     print(f"[Project] Loading from .ilean cache...")
-                    await self._load_from_cache()
-                    if self.nodes:
+                    nodes, edges = await self._load_from_cache()
+                    if nodes:
                         loaded = True
                         need_save_cache = True  # Need to save, but wait until stats calculation is complete
                         elapsed = time.time() - start_time
-                        print(f"[Project] Loaded {len(self.nodes)} nodes from .ilean in {elapsed:.2f}s")
+                        print(f"[Project] Loaded {len(nodes)} nodes from .ilean in {elapsed:.2f}s")
                     else:
                         print(f"[Project] .ilean returned no nodes")
                 except Exception as e:
@@ -176,6 +206,10 @@ class Project:
         if not loaded:
             print(f"[Project] No data loaded. Please run 'lake build' in {self.path}")
 
+        # Swap in the new graph, nothing below awaits so readers never see it half built
+        self.nodes = nodes
+        self.edges = edges
+
         # 4. Compute node statistics (dependency count, used-by count, depth)
         self._compute_node_stats()
 
@@ -209,29 +243,36 @@ class Project:
 
         # 9. Merge meta to edges (using storage)
         from .models.edge import EdgeMeta
+        self._edges_by_id = {}
         for edge in self.edges:
+            self._edges_by_id[edge.id] = edge
             meta_data = self.storage.get_edge_meta(edge.id)
             if meta_data:
                 edge.meta = EdgeMeta.from_dict(meta_data)
             else:
                 edge.meta = EdgeMeta()
 
-    async def _load_from_cache(self):
-        """Load from .lake/build cache (fast)"""
+    async def _load_from_cache(self) -> tuple[dict[str, Node], list[Edge]]:
+        """
+        Load from .lake/build cache (fast)
+
+        Returns:
+            (nodes by id, edges)
+        """
         project_path = Path(self.path)
 
-        nodes, edges = parse_project_from_cache(project_path)
+        # Parsing is CPU/IO bound, run it off the event loop so websockets and API calls stay responsive
+        parsed_nodes, edges = await asyncio.to_thread(parse_project_from_cache, project_path)
 
-        for node in nodes:
-            if node.id in self.nodes:
+        nodes: dict[str, Node] = {}
+        for node in parsed_nodes:
+            if node.id in nodes:
                 # ID conflict, add file suffix to distinguish
                 node.id = f"{node.id}@{Path(node.file_path).stem}"
-            self.nodes[node.id] = node
+            nodes[node.id] = node
 
-        # Save edges built from cache
-        self.edges = edges
-
-        print(f"[Project] Loaded {len(nodes)} declarations, {len(edges)} edges from cache")
+        print(f"[Project] Loaded {len(parsed_nodes)} declarations, {len(edges)} edges from cache")
+        return nodes, edges
 
     def _compute_node_stats(self):
         """
@@ -241,55 +282,76 @@ class Project:
         - depth 0 = doesn't depend on any other nodes (leaf nodes)
         - depth N = max(depth of all dependency nodes) + 1
         """
-        # Reset all statistics
-        for node in self.nodes.values():
+        # Build dependency graph, resetting all statistics in the same pass
+        # depends_on[A] = [B, C] means A depends on B and C
+        depends_on: dict[str, list[str]] = {}
+        used_by: dict[str, list[str]] = {}
+        for node_id, node in self.nodes.items():
             node.depends_on_count = 0
             node.used_by_count = 0
             node.depth = 0
-
-        # Build dependency graph
-        # depends_on[A] = [B, C] means A depends on B and C
-        depends_on: dict[str, list[str]] = {nid: [] for nid in self.nodes}
+            depends_on[node_id] = []
+            used_by[node_id] = []
 
         for edge in self.edges:
             # edge.source depends on edge.target
             if edge.source in self.nodes and edge.target in self.nodes:
                 depends_on[edge.source].append(edge.target)
+                if edge.source != edge.target:
+                    used_by[edge.target].append(edge.source)
                 self.nodes[edge.source].depends_on_count += 1
                 self.nodes[edge.target].used_by_count += 1
 
-        # Compute depth (using memoized recursion)
-        computed_depth: dict[str, int] = {}
-
-        def compute_depth(node_id: str, visited: set[str]) -> int:
-            """Recursively compute node depth, handling circular dependencies"""
-            if node_id in computed_depth:
-                return computed_depth[node_id]
-
-            # Detect circular dependencies
-            if node_id in visited:
-                return 0
+        # Keep adjacency for get_node_deps()
+        self._depends_on = depends_on
+        self._used_by = used_by
 
-            visited.add(node_id)
-
-            deps = depends_on.get(node_id, [])
-            if not deps:
-                # Leaf node
-                computed_depth[node_id] = 0
-            else:
-                # Depth = max(dependency node depth) + 1
-                max_dep_depth = max(compute_depth(dep, visited.copy()) for dep in deps)
-                computed_depth[node_id] = max_dep_depth + 1
+        if not self.edges:
+            # No dependencies (e.g. a fresh or empty project): every node is a leaf,
+            # depth and counts were already reset to 0 above
+            print("[Project] Stats computed: max_depth=0, max_used_by=0")
+            return
 
-            return computed_depth[node_id]
+        # Compute depth (memoized iterative DFS, deep dependency chains can't overflow the stack)
+        # Depth = max(dependency node depth) + 1, leaf nodes are 0,
+        # a dependency back onto the current path (circular) counts as 0
+        computed_depth: dict[str, int] = {}
 
-        # Compute depth for all nodes
-        for node_id in self.nodes:
-            self.nodes[node_id].depth = compute_depth(node_id, set())
+        for root_id in self.nodes:
+            if root_id in computed_depth:
+                continue
+
+            # Each frame: [node_id, iterator over its deps, max dependency depth so far]
+            stack = [[root_id, iter(depends_on.get(root_id, [])), -1]]
+            on_path = {root_id}
+
+            while stack:
+                frame = stack[-1]
+                for dep in frame[1]:
+                    if dep in computed_depth:
+                        frame[2] = max(frame[2], computed_depth[dep])
+                    elif dep in on_path:
+                        frame[2] = max(frame[2], 0)
+                    else:
+                        on_path.add(dep)
+                        stack.append([dep, iter(depends_on.get(dep, [])), -1])
+                        break
+                else:
+                    stack.pop()
+                    node_id, _, max_dep_depth = frame
+                    on_path.discard(node_id)
+                    computed_depth[node_id] = max_dep_depth + 1
+                    if stack:
+                        stack[-1][2] = max(stack[-1][2], computed_depth[node_id])
+
+        # Store depths and collect output statistics in one pass
+        max_depth = 0
+        max_used_by = 0
+        for node_id, node in self.nodes.items():
+            node.depth = computed_depth[node_id]
+            max_depth = max(max_depth, node.depth)
+            max_used_by = max(max_used_by, node.used_by_count)
 
-        # Output statistics
-        max_depth = max((n.depth for n in self.nodes.values()), default=0)
-        max_used_by = max((n.used_by_count for n in self.nodes.values()), default=0)
         print(f"[Project] Stats computed: max_depth={max_depth}, max_used_by={max_used_by}")
 
     def _set_default_styles(self):
@@ -359,7 +421,9 @@ class Project:
 
         # Update edge meta (using storage)
         from .models.edge import EdgeMeta
+        self._edges_by_id = {}
         for edge in self.edges:
+            self._edges_by_id[edge.id] = edge
             meta_data = self.storage.get_edge_meta(edge.id)
             if meta_data:
                 edge.meta = EdgeMeta.from_dict(meta_data)
@@ -408,14 +472,13 @@ class Project:
 
             # Update edge meta in memory
             from .models.edge import EdgeMeta
-            for edge in self.edges:
-                if edge.id == edge_id:
-                    meta_data = self.storage.get_edge_meta(edge_id)
-                    if meta_data:
-                        edge.meta = EdgeMeta.from_dict(meta_data)
-                    else:
-                        edge.meta = EdgeMeta()
-                    break
+            edge = self._edges_by_id.get(edge_id)
+            if edge:
+                meta_data = self.storage.get_edge_meta(edge_id)
+                if meta_data:
+                    edge.meta = EdgeMeta.from_dict(meta_data)
+                else:
+                    edge.meta = EdgeMeta()
 
     def delete_edge_meta(self, edge_id: str):
         """Delete all meta of the edge"""
@@ -434,15 +497,25 @@ class Project:
 
         # Reset edge meta in memory
         from .models.edge import EdgeMeta
-        for edge in self.edges:
-            if edge.id == edge_id:
-                edge.meta = EdgeMeta()
-                break
+        edge = self._edges_by_id.get(edge_id)
+        if edge:
+            edge.meta = EdgeMeta()
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get single node"""
         return self.nodes.get(node_id)
 
+    def get_node_deps(self, node_id: str) -> tuple[list[Node], list[Node]]:
+        """
+        Get direct dependencies of a node from the adjacency built at load time
+
+        Returns:
+            (depends_on, used_by): nodes this node depends on, nodes that depend on it
+        """
+        depends_on = [self.nodes[nid] for nid in self._depends_on.get(node_id, [])]
+        used_by = [self.nodes[nid] for nid in self._used_by.get(node_id, [])]
+        return depends_on, used_by
+
     def get_stats(self) -> dict:
         """Get project statistics"""
         kind_counts = {}
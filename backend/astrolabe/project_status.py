@@ -13,6 +13,10 @@ from typing import Optional
 import re
 
 
+# require mathlib (or similar dependency declaration) in lakefile.lean
+MATHLIB_REQUIRE = re.compile(r'require\s+.*mathlib', re.IGNORECASE)
+
+
 @dataclass
 class ProjectStatus:
     """Project status"""
@@ -66,9 +70,8 @@ def check_project_status(project_path: str) -> ProjectStatus:
     if has_build_cache:
         lib_dir = build_dir / "lib"
         if lib_dir.exists():
-            # Recursively search for .ilean files
-            ilean_files = list(lib_dir.rglob("*.ilean"))
-            has_ilean_files = len(ilean_files) > 0
+            # Recursively search for .ilean files, stopping at the first match
+            has_ilean_files = next(lib_dir.rglob("*.ilean"), None) is not None
 
     # 5. Check if depends on Mathlib
     uses_mathlib = False
@@ -76,7 +79,7 @@ def check_project_status(project_path: str) -> ProjectStatus:
         try:
             content = lakefile_lean.read_text()
             # Check for require mathlib or similar dependency declaration
-            uses_mathlib = bool(re.search(r'require\s+.*mathlib', content, re.IGNORECASE))
+            uses_mathlib = bool(MATHLIB_REQUIRE.search(content))
         except Exception:
             pass
     elif lakefile_toml.exists():
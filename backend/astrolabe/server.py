@@ -11,7 +11,10 @@ from typing import Optional, AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
 import asyncio
+import hashlib
+import heapq
 import json
+import os
 import time
 
 from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
@@ -23,6 +26,7 @@ from watchfiles import awatch
 from .project import Project
 from .graph_cache import GraphCache
 from .unified_storage import UnifiedStorage
+from .parsers.ilean_parser import clear_parse_cache
 
 
 # Project cache
@@ -36,15 +40,25 @@ def get_project(path: str) -> Project:
     return _projects[path]
 
 
+async def get_loaded_project(path: str) -> Project:
+    """Get a Project instance, loading it (or waiting for its in-flight load) if necessary"""
+    project = get_project(path)
+    await project.ensure_loaded()
+    return project
+
+
+async def get_registered_project(path: str) -> Project:
+    """Get a Project that has been loaded before, waiting for its in-flight load"""
+    if path not in _projects:
+        raise HTTPException(404, f"Project not loaded: {path}")
+    project = _projects[path]
+    await project.ensure_loaded()
+    return project
+
+
 async def get_project_storage(path: str) -> UnifiedStorage:
     """Get UnifiedStorage for a project, loading if necessary"""
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
-        if not project.storage:
-            await project.load()
+    project = await get_loaded_project(path)
     return project.storage
 
 
@@ -57,6 +71,14 @@ def should_watch_file(change_type, file_path: str) -> bool:
     )
 
 
+def _file_digest(file_path: Path) -> Optional[str]:
+    """Content digest of a file, None if it doesn't exist"""
+    try:
+        return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifecycle management"""
@@ -238,18 +260,14 @@ async def load_project(request: ProjectLoadRequest):
 @app.get("/api/project")
 async def get_project_data(path: str = Query(..., description="Project path")):
     """Get project data (must load first)"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-    return _projects[path].to_json()
+    project = await get_registered_project(path)
+    return project.to_json()
 
 
 @app.get("/api/project/node/{node_id}")
 async def get_node(node_id: str, path: str = Query(..., description="Project path")):
     """Get complete information for a single node"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
     node = project.get_node(node_id)
     if not node:
         raise HTTPException(404, f"Node not found: {node_id}")
@@ -282,17 +300,25 @@ async def read_file(
         raise HTTPException(404, f"File not found: {path}")
 
     try:
-        content = file_path.read_text(encoding="utf-8")
-        lines = content.split("\n")
-        total_lines = len(lines)
+        # Work on raw bytes; only the requested window is decoded
+        data = file_path.read_bytes()
+        if b"\r" in data:
+            # Universal newlines like read_text(): CRLF and lone CR both end a line
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        total_lines = data.count(b"\n") + 1
 
         # Calculate context range
         start_line = max(1, line - context)
         end_line = min(total_lines, line + context)
 
         # Extract content
-        selected_lines = lines[start_line - 1 : end_line]
-        selected_content = "\n".join(selected_lines)
+        if start_line > end_line:
+            # Requested window lies outside the file
+            selected_content = ""
+        else:
+            # Split off only the lines up to end_line, decode just the window
+            lines = data.split(b"\n", end_line)
+            selected_content = b"\n".join(lines[start_line - 1 : end_line]).decode("utf-8")
 
         return {
             "content": selected_content,
@@ -316,10 +342,7 @@ async def update_node_meta(
 
     Only update non-None fields (empty string and -1 will be passed to indicate deletion)
     """
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
 
     # Only update non-None fields (empty string and -1 are also passed to indicate deletion)
     update_dict = {}
@@ -337,10 +360,7 @@ async def delete_node_meta(
     node_id: str, path: str = Query(..., description="Project path")
 ):
     """Delete all meta of the node"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
     project.delete_node_meta(node_id)
 
     return {"status": "ok", "nodeId": node_id}
@@ -358,10 +378,7 @@ async def update_edge_meta(
     edge_id format is "source->target"
     Only update non-None fields (empty string and -1 will be passed to indicate deletion)
     """
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
 
     # Only update non-None fields (empty string and -1 are also passed to indicate deletion)
     update_dict = {}
@@ -379,10 +396,7 @@ async def delete_edge_meta(
     edge_id: str, path: str = Query(..., description="Project path")
 ):
     """Delete all meta of the edge"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
     project.delete_edge_meta(edge_id)
 
     return {"status": "ok", "edgeId": edge_id}
@@ -419,10 +433,7 @@ async def save_positions(request: PositionsUpdateRequest):
 @app.post("/api/project/refresh")
 async def refresh_project(path: str = Query(..., description="Project path")):
     """Refresh project (re-parse Lean files)"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    project = _projects[path]
+    project = await get_registered_project(path)
     await project.load()
 
     return {"status": "ok", "path": path, "stats": project.get_stats()}
@@ -431,10 +442,8 @@ async def refresh_project(path: str = Query(..., description="Project path")):
 @app.get("/api/project/stats")
 async def get_project_stats(path: str = Query(..., description="Project path")):
     """Get project statistics"""
-    if path not in _projects:
-        raise HTTPException(404, f"Project not loaded: {path}")
-
-    return _projects[path].get_stats()
+    project = await get_registered_project(path)
+    return project.get_stats()
 
 
 # ============================================
@@ -457,14 +466,9 @@ async def search_nodes(
     3. Match both name and id
     4. Sort by matching score (exact match > prefix match > contains match)
     """
-    if path not in _projects:
-        # Try to load project
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
-    results = []
+    matches = []  # (score, node)
     q_lower = q.strip().lower()
 
     for node in project.nodes.values():
@@ -484,7 +488,14 @@ async def search_nodes(
         else:
             continue  # No match
 
-        results.append({
+        matches.append((score, node))
+
+    # Take top limit by score, then name (ties keep node order, like a stable sort);
+    # nsmallest avoids sorting every match when only the first page is returned
+    top = heapq.nsmallest(limit, matches, key=lambda m: (-m[0], m[1].name))
+
+    results = [
+        {
             "id": node.id,
             "name": node.name,
             "kind": node.kind,
@@ -494,19 +505,9 @@ async def search_nodes(
             "dependsOnCount": node.depends_on_count,
             "usedByCount": node.used_by_count,
             "depth": node.depth,
-            "score": score,
-        })
-
-    # Sort by score (by name for empty query), take top limit
-    if q_lower:
-        results.sort(key=lambda x: (-x["score"], x["name"]))
-    else:
-        results.sort(key=lambda x: x["name"])
-    results = results[:limit]
-
-    # Remove score field
-    for r in results:
-        del r["score"]
+        }
+        for _, node in top
+    ]
 
     return {"results": results, "total": len(results)}
 
@@ -528,42 +529,18 @@ async def get_node_deps(
         depends_on: Nodes that this node depends on (upstream)
         used_by: Nodes that depend on this node (downstream)
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if node_id not in project.nodes:
         raise HTTPException(404, f"Node not found: {node_id}")
 
-    depends_on = []  # Nodes this node depends on
-    used_by = []     # Nodes that depend on this node
-
-    for edge in project.edges:
-        if edge.source == node_id:
-            # This node depends on target
-            target_node = project.nodes.get(edge.target)
-            if target_node:
-                depends_on.append({
-                    "id": target_node.id,
-                    "name": target_node.name,
-                    "kind": target_node.kind,
-                })
-        elif edge.target == node_id:
-            # source depends on this node
-            source_node = project.nodes.get(edge.source)
-            if source_node:
-                used_by.append({
-                    "id": source_node.id,
-                    "name": source_node.name,
-                    "kind": source_node.kind,
-                })
+    # Adjacency is indexed at load time, no scan over all edges
+    depends_on, used_by = project.get_node_deps(node_id)
 
     return {
         "node_id": node_id,
-        "depends_on": depends_on,
-        "used_by": used_by,
+        "depends_on": [{"id": n.id, "name": n.name, "kind": n.kind} for n in depends_on],
+        "used_by": [{"id": n.id, "name": n.name, "kind": n.kind} for n in used_by],
     }
 
 
@@ -667,11 +644,7 @@ async def clear_meta(path: str = Query(..., description="Project path")):
     Clear all metadata (node meta, edge meta, canvas).
     This is a destructive operation.
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if project.storage:
         project.storage.clear()
@@ -693,19 +666,39 @@ async def reset_project(path: str = Query(..., description="Project path")):
     This is useful for:
     - Fixing corrupted cache data
     - Starting fresh after major code changes
+
+    .astrolabe is renamed away first (one rename, so it's gone immediately),
+    the renamed directory is deleted in a background thread.
     """
     import shutil
+    import threading
+    import uuid
 
     project_path = Path(path)
     astrolabe_dir = project_path / ".astrolabe"
 
-    # Clear from in-memory cache
+    # Clear from in-memory caches; an in-flight load finishes first,
+    # otherwise it would write graph.json back into the reset directory
     if path in _projects:
-        del _projects[path]
+        await _projects[path].wait_for_load()
+        _projects.pop(path, None)
+    clear_parse_cache(project_path)
 
     # Delete .astrolabe directory
     if astrolabe_dir.exists():
-        shutil.rmtree(astrolabe_dir)
+        trash_dir = astrolabe_dir.with_name(f".astrolabe.trash-{uuid.uuid4().hex}")
+        try:
+            astrolabe_dir.rename(trash_dir)
+        except OSError:
+            # Rename not possible (e.g. file in use on Windows), delete in place
+            shutil.rmtree(astrolabe_dir)
+        else:
+            # Also sweep trash left behind by an earlier reset that didn't finish
+            def remove_trash():
+                for trash in project_path.glob(".astrolabe.trash-*"):
+                    shutil.rmtree(trash, ignore_errors=True)
+
+            threading.Thread(target=remove_trash, daemon=True).start()
 
     return {"status": "ok"}
 
@@ -778,11 +771,7 @@ async def add_user_node(request: UserNodeRequest):
     User nodes are user-defined virtual nodes that don't correspond to any Lean code.
     ID format is custom-{timestamp}, can be customized.
     """
-    if request.path not in _projects:
-        project = get_project(request.path)
-        await project.load()
-    else:
-        project = _projects[request.path]
+    project = await get_loaded_project(request.path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -819,11 +808,7 @@ async def get_user_nodes(path: str = Query(..., description="Project path")):
     """
     Get all User nodes
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -842,11 +827,7 @@ async def update_user_node(
 
     Can only update nodes with custom- prefix
     """
-    if request.path not in _projects:
-        project = get_project(request.path)
-        await project.load()
-    else:
-        project = _projects[request.path]
+    project = await get_loaded_project(request.path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -877,11 +858,7 @@ async def delete_user_node(
 
     Will cascade delete related edges and references in other nodes
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -901,11 +878,7 @@ async def add_user_edge(request: UserEdgeRequest):
 
     User edges can connect any two nodes (Lean nodes or User nodes)
     """
-    if request.path not in _projects:
-        project = get_project(request.path)
-        await project.load()
-    else:
-        project = _projects[request.path]
+    project = await get_loaded_project(request.path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -937,11 +910,7 @@ async def get_user_edges(path: str = Query(..., description="Project path")):
     """
     Get all User edges
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -960,11 +929,7 @@ async def delete_user_edge(
 
     Can only delete User edges (type=custom), cannot delete Lean edges
     """
-    if path not in _projects:
-        project = get_project(path)
-        await project.load()
-    else:
-        project = _projects[path]
+    project = await get_loaded_project(path)
 
     if not project.storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -980,6 +945,16 @@ async def delete_user_edge(
     return {"status": "ok", "edgeId": edge_id}
 
 
+def _count_lean_files(root: Path) -> int:
+    """Count .lean files under root, without descending into .lake directories"""
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk never enters .lake (dependencies, build output)
+        dirnames[:] = [d for d in dirnames if ".lake" not in d]
+        count += sum(1 for name in filenames if name.endswith(".lean"))
+    return count
+
+
 @app.get("/api/project/status")
 async def check_project_status(path: str = Query(..., description="Project path")):
     """
@@ -1037,10 +1012,7 @@ async def check_project_status(path: str = Query(..., description="Project path"
     has_cache = lake_build.exists()
 
     # Count .lean files
-    lean_files = list(project_path.rglob("*.lean"))
-    # Exclude .lake directory
-    lean_files = [f for f in lean_files if ".lake" not in str(f)]
-    lean_count = len(lean_files)
+    lean_count = _count_lean_files(project_path)
 
     # Determine if initialization is needed
     needs_init = has_lakefile and not has_cache
@@ -1101,8 +1073,18 @@ async def _run_command_with_output(
     timeout: int = 600,
     warning_time: int = None,
     process_key: str = None,
+    result: dict = None,
 ) -> AsyncGenerator[str, None]:
-    """Run command with streaming output, supporting timeout and cancellation"""
+    """
+    Run command with streaming output, supporting timeout and cancellation
+
+    Args:
+        result: Optional dict, receives the final step status under "status"
+            ("completed", "failed" or "timeout") so callers don't have to inspect messages
+    """
+    if result is None:
+        result = {}
+    result["status"] = "running"
     process = await asyncio.create_subprocess_exec(
         *cmd,
         cwd=cwd,
@@ -1129,6 +1111,7 @@ async def _run_command_with_output(
             if elapsed > timeout:
                 process.kill()
                 await process.wait()
+                result["status"] = "timeout"
                 yield f"data: {json.dumps({'type': 'step', 'step': step_name, 'status': 'timeout'})}\n\n"
                 yield f"data: {json.dumps({'type': 'error', 'message': f'{step_name} timeout ({timeout}s), terminated'})}\n\n"
                 # Return recovery suggestion
@@ -1171,8 +1154,10 @@ async def _run_command_with_output(
         await process.wait()
 
         if process.returncode == 0:
+            result["status"] = "completed"
             yield f"data: {json.dumps({'type': 'step', 'step': step_name, 'status': 'completed'})}\n\n"
         else:
+            result["status"] = "failed"
             yield f"data: {json.dumps({'type': 'step', 'step': step_name, 'status': 'failed', 'returncode': process.returncode})}\n\n"
             yield f"data: {json.dumps({'type': 'error', 'message': f'{step_name} failed with code {process.returncode}'})}\n\n"
             # Also return recovery suggestion on failure
@@ -1210,18 +1195,22 @@ async def _init_project_generator(path: str) -> AsyncGenerator[str, None]:
 
     # If using Mathlib, download cache first
     if uses_mathlib:
+        step = {}
         async for msg in _run_command_with_output(
             ["lake", "exe", "cache", "get"],
             str(project_path),
             "cache_get",
             timeout=CACHE_GET_TIMEOUT,
             process_key=f"{process_key}:cache",
+            result=step,
         ):
             yield msg
-            if '"status": "failed"' in msg or '"status": "timeout"' in msg:
-                return
+        # Stop after the failed step's error and suggestion messages have been sent
+        if step["status"] != "completed":
+            return
 
     # Run lake build
+    step = {}
     async for msg in _run_command_with_output(
         ["lake", "build"],
         str(project_path),
@@ -1229,10 +1218,11 @@ async def _init_project_generator(path: str) -> AsyncGenerator[str, None]:
         timeout=BUILD_TIMEOUT,
         warning_time=BUILD_WARNING_TIME,
         process_key=f"{process_key}:build",
+        result=step,
     ):
         yield msg
-        if '"status": "failed"' in msg or '"status": "timeout"' in msg:
-            return
+    if step["status"] != "completed":
+        return
 
     yield f"data: {json.dumps({'type': 'done', 'success': True})}\n\n"
 
@@ -1325,6 +1315,10 @@ async def watch_project(websocket: WebSocket, path: str = Query(...)):
             "path": path,
         })
 
+        # Digest of meta.json as last announced to this client, to skip no-op rewrites
+        meta_path = Path(path) / ".astrolabe" / "meta.json"
+        meta_digest = _file_digest(meta_path)
+
         # Use watchfiles to monitor directory
         async for changes in awatch(path, watch_filter=should_watch_file):
             changed_files = [str(c[1]) for c in changes]
@@ -1351,6 +1345,13 @@ async def watch_project(websocket: WebSocket, path: str = Query(...)):
                 })
 
             elif meta_changed:
+                # meta.json rewritten with identical content (or touched): nothing to announce
+                digest = _file_digest(meta_path)
+                if digest == meta_digest:
+                    print(f"[WebSocket] Meta unchanged, skipping refresh")
+                    continue
+                meta_digest = digest
+
                 # meta.json changes: Only reload meta data
                 if path in _projects:
                     try:
@@ -13,9 +13,14 @@ API design principles:
 """
 
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
+from . import json_io
+
 
 class UnifiedStorage:
     """Unified Node/Edge storage manager"""
@@ -46,6 +51,9 @@ class UnifiedStorage:
         self._graph_data = graph_data
         self._meta_path = meta_path
         self._project_path = project_path
+        # Write deferral state for batch()
+        self._batch_depth = 0
+        self._batch_dirty = False
         self._meta = self._load_meta()
 
         # Migrate canvas.json if needed
@@ -67,7 +75,7 @@ class UnifiedStorage:
     def _load_meta(self) -> dict:
         """Load meta.json"""
         if self._meta_path.exists():
-            data = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            data = json_io.loads(self._meta_path.read_bytes())
             # Ensure canvas structure exists (positions and viewport only)
             if "canvas" not in data:
                 data["canvas"] = {
@@ -94,11 +102,62 @@ class UnifiedStorage:
         }
 
     def _save_meta(self):
-        """Save meta.json"""
-        self._meta_path.parent.mkdir(parents=True, exist_ok=True)
-        self._meta_path.write_text(
-            json.dumps(self._meta, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        """Save meta.json (deferred while inside batch())"""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        # Indented: meta.json is meant to be readable and hand/agent-editable
+        content = json_io.dumps(self._meta, indent=True)
+        try:
+            self._write_meta(content)
+        except FileNotFoundError:
+            # .astrolabe is created lazily on first write
+            self._meta_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_meta(content)
+
+    def _write_meta(self, content: bytes):
+        """
+        Atomically replace meta.json with content
+
+        Writes a temp file in the same directory, then os.replace() it over meta.json,
+        so readers (file watcher, external editors) never see a half-written file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._meta_path.parent, prefix=".meta.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            # mkstemp creates 0600 files; keep the existing file's mode (or a normal 0644)
+            try:
+                mode = self._meta_path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self._meta_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer meta.json writes until the block exits.
+
+        Every mutation inside the block only updates memory; meta.json is
+        written once when the outermost block exits, and only if something changed.
+
+        Example:
+            with storage.batch():
+                storage.add_node_to_canvas("a")
+                storage.remove_node_from_canvas("b")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._save_meta()
 
     # =========================================
     # Node operations (only modify meta.json)
@@ -607,7 +666,7 @@ class UnifiedStorage:
 
         # Read old canvas.json
         try:
-            canvas_data = json.loads(canvas_path.read_text(encoding="utf-8"))
+            canvas_data = json_io.loads(canvas_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             # Corrupted or unreadable, skip migration
             return
@@ -777,6 +836,58 @@ class UnifiedStorage:
         Args:
             node_id: Node ID to remove
         """
+        if self._remove_from_canvas(node_id):
+            self._save_meta()
+
+    def remove_nodes_from_canvas(self, node_ids: list[str]):
+        """
+        Remove multiple nodes from the canvas.
+
+        Also removes their positions. meta.json is written at most once.
+
+        Args:
+            node_ids: List of node IDs to remove
+        """
+        changed = False
+        for node_id in node_ids:
+            if self._remove_from_canvas(node_id):
+                changed = True
+
+        if changed:
+            self._save_meta()
+
+    def apply_canvas_ops(self, ops: list[tuple[str, str]]):
+        """
+        Apply a sequence of canvas add/remove operations in order.
+
+        Equivalent to calling add_node_to_canvas / remove_node_from_canvas
+        for each op, but meta.json is written at most once.
+
+        Args:
+            ops: List of (op, node_id), op is "add" or "remove"
+                e.g. [("add", "a"), ("add", "b"), ("remove", "a")]
+
+        Raises:
+            ValueError: Unknown op (nothing is applied)
+        """
+        for op, _ in ops:
+            if op not in ("add", "remove"):
+                raise ValueError(f"Unknown canvas op: {op}")
+
+        with self.batch():
+            for op, node_id in ops:
+                if op == "add":
+                    self.add_node_to_canvas(node_id)
+                else:
+                    self.remove_node_from_canvas(node_id)
+
+    def _remove_from_canvas(self, node_id: str) -> bool:
+        """
+        Clear a node's visible flag and position in memory (does not save).
+
+        Returns:
+            Whether anything changed
+        """
         changed = False
 
         # Remove visible flag
@@ -795,8 +906,7 @@ class UnifiedStorage:
             del positions[node_id]
             changed = True
 
-        if changed:
-            self._save_meta()
+        return changed
 
     def clear_canvas(self):
         """
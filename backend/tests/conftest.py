@@ -0,0 +1,14 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from astrolabe.server import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared TestClient for API tests, each test still sets up its own project"""
+    return TestClient(app)
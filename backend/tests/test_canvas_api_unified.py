@@ -12,8 +12,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from fastapi.testclient import TestClient
-
 
 # We'll need to mock the project manager to return our test storage
 # The actual import will depend on how server.py is structured
@@ -50,10 +48,8 @@ def project_path(temp_project):
 class TestGetCanvasAPI:
     """Test GET /api/canvas endpoint"""
 
-    def test_get_canvas_empty(self, project_path):
+    def test_get_canvas_empty(self, client, project_path):
         """Get canvas when no canvas data exists"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         response = client.get(f"/api/canvas?path={project_path}")
 
@@ -63,7 +59,7 @@ class TestGetCanvasAPI:
         assert "positions" in data
         assert data["visible_nodes"] == []
 
-    def test_get_canvas_with_data(self, temp_project, project_path):
+    def test_get_canvas_with_data(self, client, temp_project, project_path):
         """Get canvas when canvas data exists in meta.json"""
         # Pre-populate meta.json with canvas data
         meta_path = temp_project / ".astrolabe" / "meta.json"
@@ -81,9 +77,6 @@ class TestGetCanvasAPI:
             }
         }))
 
-        from astrolabe.server import app
-        client = TestClient(app)
-
         response = client.get(f"/api/canvas?path={project_path}")
 
         assert response.status_code == 200
@@ -95,10 +88,8 @@ class TestGetCanvasAPI:
 class TestSaveCanvasAPI:
     """Test POST /api/canvas endpoint"""
 
-    def test_save_canvas_basic(self, project_path):
+    def test_save_canvas_basic(self, client, project_path):
         """Save basic canvas state"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -115,10 +106,8 @@ class TestSaveCanvasAPI:
         data = get_response.json()
         assert data["visible_nodes"] == ["Module.theorem1"]
 
-    def test_save_canvas_with_positions(self, project_path):
+    def test_save_canvas_with_positions(self, client, project_path):
         """Save canvas with positions"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -141,10 +130,8 @@ class TestSaveCanvasAPI:
 class TestAddToCanvasAPI:
     """Test POST /api/canvas/add endpoint"""
 
-    def test_add_single_node(self, project_path):
+    def test_add_single_node(self, client, project_path):
         """Add a single node to canvas"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -159,10 +146,8 @@ class TestAddToCanvasAPI:
         data = get_response.json()
         assert "Module.theorem1" in data["visible_nodes"]
 
-    def test_add_node_idempotent(self, project_path):
+    def test_add_node_idempotent(self, client, project_path):
         """Adding same node twice should not create duplicates"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {"path": project_path, "node_id": "Module.theorem1"}
 
@@ -177,10 +162,8 @@ class TestAddToCanvasAPI:
 class TestBatchAddAPI:
     """Test POST /api/canvas/add-batch endpoint"""
 
-    def test_add_batch_nodes(self, project_path):
+    def test_add_batch_nodes(self, client, project_path):
         """Add multiple nodes at once"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -199,10 +182,8 @@ class TestBatchAddAPI:
 class TestRemoveFromCanvasAPI:
     """Test POST /api/canvas/remove endpoint"""
 
-    def test_remove_node(self, project_path):
+    def test_remove_node(self, client, project_path):
         """Remove a node from canvas"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         # First add nodes
         client.post("/api/canvas/add-batch", json={
@@ -223,10 +204,8 @@ class TestRemoveFromCanvasAPI:
         assert "Module.theorem1" not in data["visible_nodes"]
         assert "Module.theorem2" in data["visible_nodes"]
 
-    def test_remove_also_removes_position(self, project_path):
+    def test_remove_also_removes_position(self, client, project_path):
         """Removing node should also remove its position"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         # Add node with position
         client.post("/api/canvas", json={
@@ -250,10 +229,8 @@ class TestRemoveFromCanvasAPI:
 class TestClearCanvasAPI:
     """Test POST /api/canvas/clear endpoint"""
 
-    def test_clear_canvas(self, project_path):
+    def test_clear_canvas(self, client, project_path):
         """Clear all canvas data"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         # First add some data
         client.post("/api/canvas", json={
@@ -276,10 +253,8 @@ class TestClearCanvasAPI:
 class TestUpdatePositionsAPI:
     """Test POST /api/canvas/positions endpoint"""
 
-    def test_update_positions(self, project_path):
+    def test_update_positions(self, client, project_path):
         """Update node positions"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -297,10 +272,8 @@ class TestUpdatePositionsAPI:
         data = get_response.json()
         assert data["positions"]["Module.theorem1"] == {"x": 10, "y": 20, "z": 30}
 
-    def test_update_positions_partial(self, project_path):
+    def test_update_positions_partial(self, client, project_path):
         """Updating some positions should not affect others"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         # Set initial positions
         client.post("/api/canvas/positions", json={
@@ -329,10 +302,8 @@ class TestUpdatePositionsAPI:
 class TestGetViewportAPI:
     """Test GET /api/canvas/viewport endpoint"""
 
-    def test_get_viewport_default(self, project_path):
+    def test_get_viewport_default(self, client, project_path):
         """Get default viewport"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         response = client.get(f"/api/canvas/viewport?path={project_path}")
         assert response.status_code == 200
@@ -341,7 +312,7 @@ class TestGetViewportAPI:
         assert "camera_position" in data
         assert "camera_target" in data
 
-    def test_get_viewport_with_data(self, temp_project, project_path):
+    def test_get_viewport_with_data(self, client, temp_project, project_path):
         """Get viewport when data exists"""
         meta_path = temp_project / ".astrolabe" / "meta.json"
         meta_path.write_text(json.dumps({
@@ -357,9 +328,6 @@ class TestGetViewportAPI:
             }
         }))
 
-        from astrolabe.server import app
-        client = TestClient(app)
-
         response = client.get(f"/api/canvas/viewport?path={project_path}")
         assert response.status_code == 200
 
@@ -372,10 +340,8 @@ class TestGetViewportAPI:
 class TestUpdateViewportAPI:
     """Test PATCH /api/canvas/viewport endpoint"""
 
-    def test_update_viewport_full(self, project_path):
+    def test_update_viewport_full(self, client, project_path):
         """Update all viewport fields"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         payload = {
             "path": project_path,
@@ -394,10 +360,8 @@ class TestUpdateViewportAPI:
         assert data["camera_position"] == [10, 20, 30]
         assert data["selected_node_id"] == "Module.theorem1"
 
-    def test_update_viewport_partial(self, project_path):
+    def test_update_viewport_partial(self, client, project_path):
         """Update only some viewport fields"""
-        from astrolabe.server import app
-        client = TestClient(app)
 
         # Set initial
         client.patch("/api/canvas/viewport", json={
@@ -424,7 +388,7 @@ class TestUpdateViewportAPI:
 class TestAPIPreservesOtherMeta:
     """Test that canvas API operations preserve other meta data"""
 
-    def test_canvas_api_preserves_node_meta(self, temp_project, project_path):
+    def test_canvas_api_preserves_node_meta(self, client, temp_project, project_path):
         """Canvas operations should not affect node notes/size"""
         meta_path = temp_project / ".astrolabe" / "meta.json"
         meta_path.write_text(json.dumps({
@@ -441,9 +405,6 @@ class TestAPIPreservesOtherMeta:
             }
         }))
 
-        from astrolabe.server import app
-        client = TestClient(app)
-
         # Perform canvas operations
         client.post("/api/canvas/add", json={
             "path": project_path,
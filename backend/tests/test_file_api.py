@@ -117,6 +117,44 @@ def my_def : Nat := 42
         assert result["totalLines"] == 7
 
 
+class TestReadFileEndpoint:
+    """Test /api/file returns the same window as reading the whole file as text"""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_newline_styles(self, client, tmp_path, newline):
+        """LF, CRLF and lone CR files all come back with LF line endings"""
+        test_file = tmp_path / "test.lean"
+        lines = ["import Mathlib", "theorem a : True := by", "  trivial", "", "def b : Nat := 1", ""]
+        test_file.write_bytes(newline.join(lines).encode("utf-8"))
+
+        for line, context in [(2, 1), (1, 0), (5, 20), (3, 2)]:
+            response = client.get("/api/file", params={"path": str(test_file), "line": line, "context": context})
+
+            assert response.status_code == 200
+            assert response.json() == read_file_logic(str(test_file), line, context)
+
+    def test_crlf_content(self, client, tmp_path):
+        """CRLF sources don't leak CR characters into the returned content"""
+        test_file = tmp_path / "test.lean"
+        test_file.write_bytes(b"import Mathlib\r\ntheorem a : True := by\r\n  trivial\r\n\r\n")
+
+        response = client.get("/api/file", params={"path": str(test_file), "line": 2, "context": 1})
+
+        assert response.json()["content"] == "import Mathlib\ntheorem a : True := by\n  trivial"
+
+
+    def test_line_far_past_end(self, client, tmp_path):
+        """An out-of-range line returns an empty window without scanning for it"""
+        test_file = tmp_path / "test.lean"
+        test_file.write_text("line 1\nline 2\nline 3")
+
+        response = client.get("/api/file", params={"path": str(test_file), "line": 10**9, "context": 5})
+
+        assert response.status_code == 200
+        assert response.json() == read_file_logic(str(test_file), 10**9, 5)
+        assert response.json()["content"] == ""
+
+
 class TestRealFile:
     """Test with real Lean files (if they exist)"""
 
@@ -20,18 +20,26 @@ MOCK_GRAPH_DATA = {
 }
 
 
-@pytest.fixture
-def storage(tmp_path):
-    """Create a UnifiedStorage instance with temp directory"""
-    meta_path = tmp_path / ".astrolabe" / "meta.json"
-    (tmp_path / ".astrolabe").mkdir()
+@pytest.fixture(scope="module")
+def shared_storage(tmp_path_factory):
+    """Create one UnifiedStorage instance shared by all tests in this module"""
+    project_path = tmp_path_factory.mktemp("graph_selection")
+    # No .astrolabe mkdir: storage creates it on first write
+    meta_path = project_path / ".astrolabe" / "meta.json"
     return UnifiedStorage(
         graph_data=MOCK_GRAPH_DATA,
         meta_path=meta_path,
-        project_path=tmp_path,
+        project_path=project_path,
     )
 
 
+@pytest.fixture
+def storage(shared_storage):
+    """Return the shared storage with all meta data cleared"""
+    shared_storage.clear()
+    return shared_storage
+
+
 class TestNodeSelectionScenarios:
     """Test node selection scenarios - simulating frontend 3D graph behavior"""
 
@@ -278,6 +286,41 @@ class TestConcurrentAccess:
         assert "node_2" not in canvas["visible_nodes"]
         assert "node_3" in canvas["visible_nodes"]
 
+    def test_multiple_nodes_interleaved_ops_replay(self, storage, monkeypatch):
+        """
+        Same interleaved sequence applied as one op list, written once
+        """
+        writes = []
+        write_meta = storage._write_meta
+
+        def counting_write_meta(content):
+            writes.append(content)
+            write_meta(content)
+
+        monkeypatch.setattr(storage, "_write_meta", counting_write_meta)
+
+        storage.apply_canvas_ops([
+            ("add", "node_1"),
+            ("add", "node_2"),
+            ("remove", "node_1"),
+            ("add", "node_3"),
+            ("add", "node_1"),  # Re-add
+            ("remove", "node_2"),
+        ])
+
+        canvas = storage.get_canvas()
+        assert set(canvas["visible_nodes"]) == {"node_1", "node_3"}
+        assert len(writes) == 1
+
+    def test_apply_canvas_ops_rejects_unknown_op(self, storage):
+        """
+        Unknown ops raise before anything is applied
+        """
+        with pytest.raises(ValueError):
+            storage.apply_canvas_ops([("add", "node_1"), ("toggle", "node_2")])
+
+        assert "node_1" not in storage.get_canvas()["visible_nodes"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
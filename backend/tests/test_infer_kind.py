@@ -0,0 +1,36 @@
+"""
+Test declaration kind inference from declaration content
+"""
+import pytest
+
+from astrolabe.parsers.ilean_parser import infer_kind
+
+
+class TestInferKind:
+    """Test infer_kind()"""
+
+    @pytest.mark.parametrize("content, kind", [
+        ("theorem foo : 1 = 1 := rfl", "theorem"),
+        ("lemma foo : 1 = 1 := rfl", "lemma"),
+        ("def foo : Nat := 1", "definition"),
+        ("abbrev Foo := Nat", "definition"),
+        ("noncomputable def bar : Real := 0", "definition"),
+        ("@[simp] protected lemma baz : P := h", "lemma"),
+        ("private theorem qux : P := by\n  sorry", "theorem"),
+        ("structure Point where\n  x : Nat", "structure"),
+        ("class Foo (α : Type) where", "class"),
+        ("instance : Foo Nat := ⟨⟩", "instance"),
+        ("axiom choice : P", "axiom"),
+        ("inductive Tree where", "inductive"),
+        ("example : 1 = 1 := rfl", "example"),
+        ("opaque secret : Nat", "opaque"),
+        ("\n\n  theorem indented : P := h", "theorem"),
+    ])
+    def test_keyword_kinds(self, content, kind):
+        """Each declaration keyword maps to its node kind"""
+        assert infer_kind(content) == kind
+
+    @pytest.mark.parametrize("content", ["", "   ", "foo bar", "-- theorem in comment"])
+    def test_fallback_definition(self, content):
+        """Content without a declaration keyword falls back to definition"""
+        assert infer_kind(content) == "definition"
@@ -0,0 +1,47 @@
+"""
+Test project init command streaming
+
+Covers _run_command_with_output reporting the step result to its caller,
+so _init_project_generator can stop on failure without matching message text.
+"""
+import json
+import sys
+
+from astrolabe.server import _run_command_with_output
+
+
+async def run(cmd: list[str], tmp_path, **kwargs) -> tuple[list[dict], dict]:
+    """Collect parsed SSE events and the result dict"""
+    result = {}
+    events = []
+    async for msg in _run_command_with_output(cmd, str(tmp_path), "step", result=result, **kwargs):
+        assert msg.startswith("data: ")
+        events.append(json.loads(msg[len("data: "):]))
+    return events, result
+
+
+class TestRunCommandResult:
+    """Test result status of _run_command_with_output"""
+
+    async def test_completed(self, tmp_path):
+        """Zero exit code reports completed"""
+        events, result = await run([sys.executable, "-c", "print('hello')"], tmp_path)
+
+        assert result["status"] == "completed"
+        assert {"type": "output", "line": "hello"} in events
+        assert events[-1] == {"type": "step", "step": "step", "status": "completed"}
+
+    async def test_failed_sends_error_and_suggestion(self, tmp_path):
+        """Non-zero exit code reports failed, after all failure messages"""
+        events, result = await run([sys.executable, "-c", "raise SystemExit(3)"], tmp_path)
+
+        assert result["status"] == "failed"
+        assert [e["type"] for e in events[-3:]] == ["step", "error", "suggestion"]
+        assert events[-3]["returncode"] == 3
+
+    async def test_output_mentioning_failed_status(self, tmp_path):
+        """Build output that looks like a failure message doesn't fail the step"""
+        script = 'print(\'"status": "failed"\')'
+        events, result = await run([sys.executable, "-c", script], tmp_path)
+
+        assert result["status"] == "completed"
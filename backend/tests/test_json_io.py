@@ -0,0 +1,48 @@
+"""
+Test JSON I/O helpers
+
+Both the orjson and the standard library backend must produce
+equivalent output and raise json.JSONDecodeError on bad input.
+"""
+
+import json
+
+import pytest
+
+from astrolabe import json_io
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with both backends"""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+class TestJsonIO:
+    """Test json_io.loads / json_io.dumps"""
+
+    def test_round_trip(self, backend):
+        """dumps -> loads returns the original data"""
+        data = {"nodes": [{"id": "Module.theorem_α", "line_number": 10, "size": 1.5}], "ok": True}
+        assert json_io.loads(json_io.dumps(data)) == data
+        assert json_io.loads(json_io.dumps(data, indent=True)) == data
+
+    def test_non_ascii_kept_as_utf8(self, backend):
+        """Unicode identifiers are written as UTF-8, not \\u escapes"""
+        encoded = json_io.dumps({"name": "lemma_∀x"})
+        assert "lemma_∀x".encode("utf-8") in encoded
+
+    def test_indent_is_two_spaces(self, backend):
+        """indent=True produces the same layout as json.dumps(indent=2)"""
+        data = {"a": {"b": [1, 2]}}
+        assert json_io.dumps(data, indent=True).decode("utf-8") == json.dumps(data, indent=2)
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        """Decode errors are json.JSONDecodeError for both backends"""
+        with pytest.raises(json.JSONDecodeError):
+            json_io.loads(b"{not json")
@@ -242,6 +242,83 @@ class TestNodeLineNumberStorage:
             f"Expected 1-indexed line 5, got {simple_node.line_number}"
 
 
+class TestIleanParseCache:
+    """Test memoization of parse_ilean_file results"""
+
+    def _write_project(self, tmp_path):
+        ilean_file = tmp_path / ".lake" / "build" / "lib" / "lean" / "Test.ilean"
+        ilean_file.parent.mkdir(parents=True, exist_ok=True)
+        ilean_file.write_text(json.dumps({
+            "module": "Test",
+            "directImports": [],
+            "references": {
+                '{"c":{"m":"Test","n":"simple"}}': {
+                    "definition": [0, 8, 0, 14],
+                    "usages": []
+                }
+            }
+        }))
+        lean_file = tmp_path / "Test.lean"
+        lean_file.write_text("theorem simple : True := trivial\n")
+        return ilean_file, lean_file
+
+    def test_cached_result_returns_fresh_nodes(self, tmp_path):
+        """Repeated parses return equal but independent Node objects"""
+        from astrolabe.parsers.ilean_parser import parse_ilean_file
+
+        ilean_file, _ = self._write_project(tmp_path)
+
+        first, _, _ = parse_ilean_file(ilean_file, tmp_path)
+        first[0].id = "Renamed.simple"
+        first[0].references.append("Test.other")
+
+        second, _, _ = parse_ilean_file(ilean_file, tmp_path)
+        assert second[0].id == "Test.simple"
+        assert second[0].references == []
+        assert second[0] is not first[0]
+
+    def test_source_change_invalidates_cache(self, tmp_path):
+        """Editing the .lean source re-parses the file"""
+        from astrolabe.models.node import ProofStatus
+        from astrolabe.parsers.ilean_parser import parse_ilean_file
+
+        ilean_file, lean_file = self._write_project(tmp_path)
+
+        nodes, _, _ = parse_ilean_file(ilean_file, tmp_path)
+        assert nodes[0].status == ProofStatus.PROVEN
+
+        lean_file.write_text("theorem simple : True := by sorry\n")
+
+        nodes, _, _ = parse_ilean_file(ilean_file, tmp_path)
+        assert nodes[0].status == ProofStatus.SORRY
+
+    def test_cache_keeps_recent_projects_only(self, tmp_path):
+        """Parse results are kept for a bounded number of projects"""
+        from astrolabe.parsers import ilean_parser
+
+        roots = []
+        for i in range(ilean_parser._PARSE_CACHE_MAX_PROJECTS + 1):
+            root = tmp_path / f"project{i}"
+            ilean_file, _ = self._write_project(root)
+            ilean_parser.parse_ilean_file(ilean_file, root)
+            roots.append(str(root))
+
+        assert roots[0] not in ilean_parser._PARSE_CACHE
+        assert roots[-1] in ilean_parser._PARSE_CACHE
+        assert len(ilean_parser._PARSE_CACHE) <= ilean_parser._PARSE_CACHE_MAX_PROJECTS
+
+    def test_decode_ref_key(self):
+        """Reference keys decode to (module, name), non-constant keys to None"""
+        from astrolabe.parsers.ilean_parser import _decode_ref_key
+
+        key = '{"c":{"m":"Test.Module","n":"simple"}}'
+        assert _decode_ref_key(key) == ("Test.Module", "simple")
+        assert _decode_ref_key(key) is _decode_ref_key(key)
+        assert _decode_ref_key('{"f":{"m":"Test.Module","n":"x"}}') is None
+        with pytest.raises(json.JSONDecodeError):
+            _decode_ref_key("not json")
+
+
 class TestFrontendLineNumberFlow:
     """Test frontend line number receiving and usage flow"""
 
@@ -122,6 +122,12 @@ class TestEdge:
         assert d["fromLean"] is True
         assert d["visible"] is True
 
+    def test_graph_models_use_slots(self):
+        node = Node(id="A", name="A", kind="theorem", file_path="A.lean", line_number=1)
+        edge = Edge(source="A", target="B")
+        for obj in (node, node.meta, edge, edge.meta):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestProofStatus:
     def test_status_values(self):
@@ -0,0 +1,203 @@
+"""
+Test Project in-memory graph state
+
+Covers Project.update_edge_meta / delete_edge_meta / reload_meta
+keeping node and edge objects in step with meta.json,
+the node statistics computed after loading, and overlapping loads.
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from astrolabe.models.node import Node
+from astrolabe.models.edge import Edge
+from astrolabe import server
+from astrolabe.project import Project
+
+
+def make_node(node_id: str) -> Node:
+    return Node(
+        id=node_id,
+        name=node_id.split(".")[-1],
+        kind="theorem",
+        file_path="/test/file.lean",
+        line_number=1,
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with three nodes and a chain a -> b -> c, no Lean build required"""
+    project = Project(str(tmp_path))
+    for node_id in ["a", "b", "c"]:
+        project.nodes[node_id] = make_node(node_id)
+    project.edges = [Edge(source="a", target="b"), Edge(source="b", target="c")]
+    project.reload_meta()
+    return project
+
+
+class TestEdgeMetaSync:
+    """Test edge meta updates reach the in-memory Edge objects"""
+
+    def test_update_edge_meta(self, project):
+        """update_edge_meta should update the matching Edge"""
+        project.update_edge_meta("a->b", {"style": "dashed", "notes": "key step"})
+
+        edge = project.edges[0]
+        assert edge.meta.style == "dashed"
+        assert edge.meta.notes == "key step"
+        assert project.edges[1].meta.style is None
+
+    def test_delete_edge_meta(self, project):
+        """delete_edge_meta should reset the matching Edge meta"""
+        project.update_edge_meta("b->c", {"style": "dotted"})
+        project.delete_edge_meta("b->c")
+
+        assert project.edges[1].meta.style is None
+
+    def test_update_unknown_edge(self, project):
+        """Unknown edge ids should not touch existing edges"""
+        project.update_edge_meta("x->y", {"style": "dashed"})
+
+        assert all(edge.meta.style is None for edge in project.edges)
+
+
+class TestReloadMeta:
+    """Test reload_meta resyncs nodes and edges with meta.json"""
+
+    def test_reload_after_direct_storage_write(self, project):
+        """Writes made straight through storage (e.g. /api/meta/clear) reach the nodes"""
+        project.update_node_meta("a", {"notes": "hello"})
+        project.storage.clear()
+
+        project.reload_meta()
+        assert project.nodes["a"].meta.notes is None
+
+    def test_reload_after_external_write(self, project):
+        """reload_meta picks up meta.json edited by another writer"""
+        meta_path = project.project_path / ".astrolabe" / "meta.json"
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path.write_text(json.dumps({"nodes": {}, "edges": {"b->c": {"notes": "external"}}}))
+
+        project.reload_meta()
+        assert project.edges[1].meta.notes == "external"
+
+
+class TestNodeStats:
+    """Test Project._compute_node_stats()"""
+
+    def test_chain_depth(self, project):
+        """Depth counts the longest dependency chain, leaves are 0"""
+        project._compute_node_stats()
+
+        assert [project.nodes[n].depth for n in ["a", "b", "c"]] == [2, 1, 0]
+        assert project.nodes["a"].depends_on_count == 1
+        assert project.nodes["c"].used_by_count == 1
+
+    def test_cycle_terminates(self, project):
+        """Circular dependencies don't loop forever"""
+        project.edges.append(Edge(source="c", target="a"))
+        project._compute_node_stats()
+
+        assert all(node.depth >= 1 for node in project.nodes.values())
+
+    def test_node_deps_from_adjacency(self, project):
+        """get_node_deps returns direct upstream and downstream nodes"""
+        project._compute_node_stats()
+
+        depends_on, used_by = project.get_node_deps("b")
+        assert [n.id for n in depends_on] == ["c"]
+        assert [n.id for n in used_by] == ["a"]
+        assert project.get_node_deps("missing") == ([], [])
+
+    def test_no_edges(self, project):
+        """Without edges every node is a leaf and stale stats are cleared"""
+        project._compute_node_stats()
+        project.edges = []
+        project._compute_node_stats()
+
+        assert all(node.depth == 0 for node in project.nodes.values())
+        assert all(node.used_by_count == 0 for node in project.nodes.values())
+        assert project.get_node_deps("a") == ([], [])
+
+    def test_deep_chain_beyond_recursion_limit(self, tmp_path):
+        """Chains deeper than Python's recursion limit still get a depth"""
+        import sys
+
+        length = sys.getrecursionlimit() + 500
+        project = Project(str(tmp_path))
+        for i in range(length):
+            project.nodes[f"n{i}"] = make_node(f"n{i}")
+        project.edges = [Edge(source=f"n{i}", target=f"n{i + 1}") for i in range(length - 1)]
+
+        project._compute_node_stats()
+
+        assert project.nodes["n0"].depth == length - 1
+
+
+class TestConcurrentLoad:
+    """Test overlapping Project.load() calls"""
+
+    async def test_overlapping_loads_do_not_duplicate_nodes(self, tmp_path, monkeypatch):
+        """Two loads racing on the same project give the same graph as one load"""
+        (tmp_path / ".lake" / "build" / "lib").mkdir(parents=True)
+
+        def fake_parse(project_path):
+            nodes = [make_node(f"M.n{i}") for i in range(3)]
+            return nodes, [Edge(source="M.n0", target="M.n1")]
+
+        monkeypatch.setattr("astrolabe.project.parse_project_from_cache", fake_parse)
+
+        project = Project(str(tmp_path))
+        await asyncio.gather(project.load(), project.load())
+
+        assert sorted(project.nodes) == ["M.n0", "M.n1", "M.n2"]
+        cached = json.loads((tmp_path / ".astrolabe" / "graph.json").read_text())
+        assert len(cached["nodes"]) == 3
+
+    async def test_requests_wait_for_inflight_load(self, tmp_path, monkeypatch):
+        """Handlers called while the first load is parsing see the loaded project"""
+        (tmp_path / ".lake" / "build" / "lib").mkdir(parents=True)
+
+        def slow_parse(project_path):
+            time.sleep(0.2)
+            return [make_node("M.n0")], []
+
+        monkeypatch.setattr("astrolabe.project.parse_project_from_cache", slow_parse)
+        monkeypatch.setattr(server, "_projects", {})
+        path = str(tmp_path)
+
+        load = asyncio.create_task(server.load_project(server.ProjectLoadRequest(path=path)))
+        await asyncio.sleep(0.05)  # load is now parsing in its worker thread
+
+        user_nodes, search = await asyncio.gather(
+            server.get_user_nodes(path=path),
+            server.search_nodes(path=path, q="n0", limit=50),
+        )
+        await load
+
+        assert user_nodes == {"status": "ok", "nodes": []}
+        assert [r["id"] for r in search["results"]] == ["M.n0"]
+
+    async def test_reset_waits_for_inflight_load(self, tmp_path, monkeypatch):
+        """A reset during a load isn't undone by the load writing graph.json afterwards"""
+        (tmp_path / ".lake" / "build" / "lib").mkdir(parents=True)
+
+        def slow_parse(project_path):
+            time.sleep(0.2)
+            return [make_node("M.n0")], []
+
+        monkeypatch.setattr("astrolabe.project.parse_project_from_cache", slow_parse)
+        monkeypatch.setattr(server, "_projects", {})
+        path = str(tmp_path)
+
+        load = asyncio.create_task(server.load_project(server.ProjectLoadRequest(path=path)))
+        await asyncio.sleep(0.05)
+
+        await server.reset_project(path=path)
+        await load
+
+        assert not (tmp_path / ".astrolabe" / "graph.json").exists()
+        assert path not in server._projects
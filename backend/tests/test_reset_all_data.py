@@ -6,13 +6,12 @@ Reset All Data should:
 2. Force re-parsing from .ilean on next load
 """
 
+import json
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
-from fastapi.testclient import TestClient
 
-from astrolabe.server import app
 from astrolabe.graph_cache import GraphCache
 
 
@@ -48,17 +47,15 @@ def temp_project():
 class TestResetAllDataAPI:
     """Test /api/reset endpoint"""
 
-    def test_reset_endpoint_exists(self, temp_project):
+    def test_reset_endpoint_exists(self, client, temp_project):
         """Test that /api/reset endpoint exists"""
-        client = TestClient(app)
         response = client.post(f"/api/reset?path={temp_project}")
 
         # Should not return 404
         assert response.status_code != 404, "API endpoint /api/reset should exist"
 
-    def test_reset_deletes_astrolabe_directory(self, temp_project):
+    def test_reset_deletes_astrolabe_directory(self, client, temp_project):
         """Test that reset deletes the .astrolabe directory"""
-        client = TestClient(app)
 
         astrolabe_dir = temp_project / ".astrolabe"
         assert astrolabe_dir.exists(), "Precondition: .astrolabe should exist"
@@ -69,9 +66,8 @@ class TestResetAllDataAPI:
         # .astrolabe directory should be deleted
         assert not astrolabe_dir.exists(), ".astrolabe directory should be deleted after reset"
 
-    def test_reset_returns_success(self, temp_project):
+    def test_reset_returns_success(self, client, temp_project):
         """Test that reset returns success status"""
-        client = TestClient(app)
 
         response = client.post(f"/api/reset?path={temp_project}")
         assert response.status_code == 200
@@ -79,13 +75,27 @@ class TestResetAllDataAPI:
         data = response.json()
         assert data.get("status") == "ok"
 
+    def test_reset_removes_trash_in_background(self, client, temp_project):
+        """Test that the renamed-away .astrolabe is deleted shortly after reset"""
+        import time
+
+        # Leftover from an interrupted earlier reset
+        (temp_project / ".astrolabe.trash-stale").mkdir()
+
+        response = client.post(f"/api/reset?path={temp_project}")
+        assert response.status_code == 200
+
+        deadline = time.time() + 5
+        while list(temp_project.glob(".astrolabe*")) and time.time() < deadline:
+            time.sleep(0.01)
+        assert list(temp_project.glob(".astrolabe*")) == []
+
 
 class TestResetClearsProjectCache:
     """Test that reset clears the in-memory project cache"""
 
-    def test_reset_clears_project_from_cache(self, temp_project):
+    def test_reset_clears_project_from_cache(self, client, temp_project):
         """Test that reset removes project from _projects cache"""
-        client = TestClient(app)
 
         # First load the project to add it to cache
         # (We can't easily test this without the full project structure,
@@ -101,9 +111,8 @@ class TestResetClearsProjectCache:
 class TestResetTriggersReparse:
     """Test that after reset, next load will re-parse from .ilean"""
 
-    def test_graph_cache_invalid_after_reset(self, temp_project):
+    def test_graph_cache_invalid_after_reset(self, client, temp_project):
         """Test that GraphCache.is_valid() returns False after reset"""
-        client = TestClient(app)
 
         # Reset
         response = client.post(f"/api/reset?path={temp_project}")
@@ -113,6 +122,38 @@ class TestResetTriggersReparse:
         cache = GraphCache(str(temp_project))
         assert not cache.is_valid(), "GraphCache should be invalid after reset"
 
+    def test_reset_forces_ilean_reparse(self, client, temp_project, monkeypatch):
+        """Memoized .ilean parse results are dropped, the next load parses again"""
+        from astrolabe.parsers import ilean_parser
+
+        ilean_file = temp_project / ".lake" / "build" / "lib" / "lean" / "Test.ilean"
+        ilean_file.parent.mkdir(parents=True)
+        ilean_file.write_text(json.dumps({
+            "module": "Test",
+            "directImports": [],
+            "references": {'{"c":{"m":"Test","n":"simple"}}': {"definition": [0, 8, 0, 14], "usages": []}},
+        }))
+        (temp_project / "Test.lean").write_text("theorem simple : True := trivial\n")
+
+        calls = []
+        uncached = ilean_parser._parse_ilean_file_uncached
+
+        def counting_parse(*args, **kwargs):
+            calls.append(args[0])
+            return uncached(*args, **kwargs)
+
+        monkeypatch.setattr(ilean_parser, "_parse_ilean_file_uncached", counting_parse)
+
+        ilean_parser.parse_ilean_file(ilean_file, temp_project)
+        ilean_parser.parse_ilean_file(ilean_file, temp_project)
+        assert len(calls) == 1
+
+        response = client.post(f"/api/reset?path={temp_project}")
+        assert response.status_code == 200
+
+        ilean_parser.parse_ilean_file(ilean_file, temp_project)
+        assert len(calls) == 2
+
 
 class TestCanvasAfterReset:
     """Test canvas operations after reset
@@ -123,11 +164,10 @@ class TestCanvasAfterReset:
     reset clears all existing data.
     """
 
-    def test_viewport_save_after_reset_creates_fresh_data(self, temp_project):
+    def test_viewport_save_after_reset_creates_fresh_data(self, client, temp_project):
         """
         After reset, saving viewport recreates .astrolabe with fresh data.
         """
-        client = TestClient(app)
         astrolabe_dir = temp_project / ".astrolabe"
 
         # Verify .astrolabe exists before reset
@@ -154,11 +194,10 @@ class TestCanvasAfterReset:
         data = response.json()
         assert data["camera_position"] == [0, 0, 50]
 
-    def test_canvas_save_after_reset_creates_fresh_data(self, temp_project):
+    def test_canvas_save_after_reset_creates_fresh_data(self, client, temp_project):
         """
         After reset, canvas operations recreate .astrolabe with fresh data.
         """
-        client = TestClient(app)
         astrolabe_dir = temp_project / ".astrolabe"
 
         # Reset
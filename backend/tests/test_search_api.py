@@ -0,0 +1,56 @@
+"""
+Test Search API
+
+Verifies /api/project/search ranking and limit handling.
+"""
+
+import pytest
+
+from astrolabe import server
+from astrolabe.models.node import Node
+from astrolabe.project import Project
+
+
+@pytest.fixture
+def project_path(tmp_path, monkeypatch):
+    """Register an in-memory project with a handful of nodes, no Lean build required"""
+    project = Project(str(tmp_path))
+    for node_id in ["M.add_comm", "M.add", "M.zero_add", "M.mul_comm", "M.add_zero"]:
+        project.nodes[node_id] = Node(
+            id=node_id,
+            name=node_id.split(".")[-1],
+            kind="theorem",
+            file_path="/test/file.lean",
+            line_number=1,
+        )
+    project.reload_meta()  # Creates storage, so the project counts as loaded
+    monkeypatch.setitem(server._projects, str(tmp_path), project)
+    return str(tmp_path)
+
+
+class TestSearchAPI:
+    """Test GET /api/project/search"""
+
+    def test_ranked_by_score_then_name(self, client, project_path):
+        """Exact match first, then prefix matches, then contains matches, each by name"""
+        response = client.get("/api/project/search", params={"path": project_path, "q": "add"})
+
+        assert response.status_code == 200
+        names = [r["name"] for r in response.json()["results"]]
+        assert names == ["add", "add_comm", "add_zero", "zero_add"]
+        assert "score" not in response.json()["results"][0]
+
+    def test_empty_query_sorted_by_name(self, client, project_path):
+        """Empty query returns every node sorted by name"""
+        response = client.get("/api/project/search", params={"path": project_path})
+
+        names = [r["name"] for r in response.json()["results"]]
+        assert names == ["add", "add_comm", "add_zero", "mul_comm", "zero_add"]
+
+    def test_limit(self, client, project_path):
+        """Only the top limit results are returned"""
+        response = client.get("/api/project/search", params={"path": project_path, "q": "add", "limit": 2})
+
+        data = response.json()
+        assert [r["name"] for r in data["results"]] == ["add", "add_comm"]
+        assert data["total"] == 2
@@ -0,0 +1,41 @@
+"""
+Test sorry detection in declaration content
+
+detect_sorry must find the sorry keyword in code but ignore it inside comments.
+"""
+import pytest
+
+from astrolabe.parsers.ilean_parser import detect_sorry
+
+
+class TestDetectSorry:
+    """Test detect_sorry()"""
+
+    @pytest.mark.parametrize("content", [
+        "theorem foo : 1 = 1 := by sorry",
+        "theorem foo : 1 = 1 := sorry",
+        "theorem foo : P := by\n  intro h\n  sorry\n",
+        "theorem foo : P := by\n  -- todo\n  sorry",
+        "theorem foo : P := by /- step -/ sorry",
+    ])
+    def test_sorry_in_code(self, content):
+        """sorry used as a term or tactic is detected"""
+        assert detect_sorry(content) is True
+
+    @pytest.mark.parametrize("content", [
+        "",
+        "theorem foo : 1 = 1 := rfl",
+        "theorem foo : 1 = 1 := rfl -- was sorry",
+        "/- sorry -/ theorem foo : 1 = 1 := rfl",
+        "/-\n  sorry\n  sorry\n-/\ntheorem foo : 1 = 1 := rfl",
+        "theorem sorryless : 1 = 1 := rfl",
+        "theorem foo : 1 = 1 := unsorry_helper",
+    ])
+    def test_no_sorry_in_code(self, content):
+        """sorry only in comments or as part of an identifier is ignored"""
+        assert detect_sorry(content) is False
+
+    def test_line_comment_does_not_open_block_comment(self):
+        """/- inside a line comment doesn't hide code on later lines"""
+        content = "theorem foo : P := by\n  -- see /- note\n  sorry\n  -- end -/"
+        assert detect_sorry(content) is True
@@ -855,3 +855,52 @@ class TestClearOperation:
         # Lean edges still exist
         edges = storage.get_all_edges()
         assert len(edges) == 1  # 1 Lean edge
+
+
+# ============================================
+# 9. Write Tests
+# ============================================
+
+class TestWrites:
+    """meta.json writes"""
+
+    def test_first_write_creates_astrolabe_dir(self, tmp_path):
+        """.astrolabe is created on first write, not on construction"""
+        meta_path = tmp_path / ".astrolabe" / "meta.json"
+        storage = UnifiedStorage(graph_data=MOCK_GRAPH_DATA, meta_path=meta_path)
+        assert not meta_path.parent.exists()
+
+        storage.add_node_to_canvas("Mathlib.Algebra.Ring.add_comm")
+
+        assert meta_path.exists()
+
+
+# ============================================
+# 10. Atomic Write Tests
+# ============================================
+
+class TestAtomicWrite:
+    """meta.json is replaced atomically"""
+
+    def test_no_temp_files_left(self, storage, meta_path):
+        """Saving leaves only meta.json in .astrolabe"""
+        storage.update_node_meta("Mathlib.Algebra.Ring.add_comm", notes="a")
+        storage.update_node_meta("Mathlib.Algebra.Ring.add_comm", notes="b")
+
+        assert [p.name for p in meta_path.parent.iterdir()] == ["meta.json"]
+        assert json.loads(meta_path.read_text())["nodes"]["Mathlib.Algebra.Ring.add_comm"]["notes"] == "b"
+
+    def test_failed_write_keeps_previous_file(self, storage, meta_path, monkeypatch):
+        """If the write fails, the previous meta.json is left intact"""
+        storage.update_node_meta("Mathlib.Algebra.Ring.add_comm", notes="kept")
+        before = meta_path.read_text()
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("astrolabe.unified_storage.os.replace", fail)
+        with pytest.raises(OSError):
+            storage.update_node_meta("Mathlib.Algebra.Ring.add_comm", notes="lost")
+
+        assert meta_path.read_text() == before
+        assert [p.name for p in meta_path.parent.iterdir()] == ["meta.json"]
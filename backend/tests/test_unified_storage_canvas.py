@@ -198,6 +198,17 @@ class TestCanvasBasicOperations:
         assert "Module.theorem1" not in canvas["positions"]
         assert "Module.theorem2" in canvas["positions"]
 
+    def test_remove_nodes_from_canvas_batch(self, storage):
+        """Remove multiple nodes (and their positions) at once"""
+        storage.set_visible_nodes(["Module.theorem1", "Module.theorem2", "Module.lemma1"])
+        storage.set_positions({"Module.theorem1": {"x": 1, "y": 2, "z": 3}})
+
+        storage.remove_nodes_from_canvas(["Module.theorem1", "Module.theorem2"])
+
+        canvas = storage.get_canvas()
+        assert canvas["visible_nodes"] == ["Module.lemma1"]
+        assert canvas["positions"] == {}
+
     def test_remove_nonexistent_node(self, storage):
         """Removing a node that doesn't exist should not error"""
         storage.set_visible_nodes(["Module.theorem1"])
@@ -222,6 +233,40 @@ class TestCanvasBasicOperations:
         assert canvas["positions"] == {}
 
 
+class TestCanvasBatch:
+    """Test deferring meta.json writes with batch()"""
+
+    def test_batch_defers_write_until_exit(self, storage, meta_path):
+        """Mutations inside batch() are only written when the block exits"""
+        with storage.batch():
+            storage.add_node_to_canvas("Module.theorem1")
+            storage.add_node_to_canvas("Module.theorem2")
+            storage.remove_node_from_canvas("Module.theorem1")
+            assert not meta_path.exists()
+            # In-memory state is already up to date
+            assert storage.get_visible_nodes() == ["Module.theorem2"]
+
+        with open(meta_path, "r") as f:
+            data = json.load(f)
+        assert data["nodes"] == {"Module.theorem2": {"visible": True}}
+
+    def test_nested_batch_writes_once_at_outermost_exit(self, storage, meta_path):
+        """Only the outermost batch() writes meta.json"""
+        with storage.batch():
+            with storage.batch():
+                storage.add_node_to_canvas("Module.theorem1")
+            assert not meta_path.exists()
+
+        assert meta_path.exists()
+
+    def test_batch_without_changes_does_not_write(self, storage, meta_path):
+        """An empty batch leaves meta.json untouched"""
+        with storage.batch():
+            storage.get_canvas()
+
+        assert not meta_path.exists()
+
+
 class TestCanvasPositionOperations:
     """Test position-related canvas operations"""
 